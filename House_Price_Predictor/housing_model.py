@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+BASE_FEATURES = ["area", "bedrooms", "bathrooms", "parking", "stories",
+                 "airconditioning", "basement", "hotwaterheating",
+                 "guestroom", "mainroad", "prefarea"]
+
+BINARY_COLS = ['airconditioning', 'hotwaterheating', 'basement', 'guestroom', 'mainroad', 'prefarea']
+
+FURNISHING_MAP = {'unfurnished': 0, 'semi-furnished': 1, 'furnished': 2}
+
+PARAM_GRID = {
+    'n_estimators': [100, 200],
+    'max_depth': [10, 20, None],
+    'min_samples_split': [2, 5],
+}
+
+
+def load(path="housing.csv") -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+def features_for(df: pd.DataFrame) -> list:
+    features = list(BASE_FEATURES)
+    if 'furnishingstatus' in df.columns:
+        features.append("furnishingstatus")
+    return features
+
+
+def encode(df: pd.DataFrame) -> pd.DataFrame:
+    """Map the yes/no and furnishing columns of housing.csv to integers."""
+    data = df.copy()
+    for col in BINARY_COLS:
+        data[col] = data[col].map({'yes': 1, 'no': 0})
+
+    if 'furnishingstatus' in data.columns:
+        data['furnishingstatus'] = data['furnishingstatus'].map(FURNISHING_MAP)
+    return data
+
+
+def train_model(df: pd.DataFrame, param_grid=PARAM_GRID, cv=5):
+    """Grid-search a random forest on log(price) and return the best estimator."""
+    # sklearn is the slowest import in the app; defer it to the first fit.
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.model_selection import GridSearchCV
+
+    data = encode(df)
+    X = data[features_for(df)]
+    y = np.log(data["price"])
+
+    rf = RandomForestRegressor(random_state=42)
+    grid_search = GridSearchCV(rf, param_grid, cv=cv, scoring='r2', n_jobs=-1)
+    grid_search.fit(X, y)
+    return grid_search.best_estimator_
+
+
+def predict_prices(model, rows) -> np.ndarray:
+    return np.exp(model.predict(rows))
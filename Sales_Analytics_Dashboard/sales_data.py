@@ -0,0 +1,39 @@
+import pandas as pd
+
+
+def load(path="sales.csv") -> pd.DataFrame:
+    return pd.read_csv(path)
+
+
+def total_by(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """Sales_Amount summed per value of ``col``."""
+    return df.groupby(col)['Sales_Amount'].sum().reset_index()
+
+
+def add_month(df: pd.DataFrame) -> pd.DataFrame:
+    df['Sale_Date'] = pd.to_datetime(df['Sale_Date'])
+    df['Month'] = df['Sale_Date'].dt.to_period('M')
+    return df
+
+
+def monthly_totals(df: pd.DataFrame) -> pd.DataFrame:
+    sales_trends = df.groupby('Month')['Sales_Amount'].sum().reset_index()
+    sales_trends['Month'] = sales_trends['Month'].astype(str)
+    return sales_trends
+
+
+def monthly_totals_by(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    """Month x ``col`` pivot of Sales_Amount, ready for st.line_chart."""
+    trends = df.groupby(['Month', col])['Sales_Amount'].sum().reset_index()
+    trends['Month'] = trends['Month'].astype(str)
+    return trends.pivot(index='Month', columns=col, values='Sales_Amount')
+
+
+def top_sales_reps(df: pd.DataFrame, n=10) -> pd.DataFrame:
+    return total_by(df, 'Sales_Rep').sort_values(by='Sales_Amount', ascending=False).head(n)
+
+
+def counts(df: pd.DataFrame, col: str) -> pd.DataFrame:
+    out = df[col].value_counts().reset_index()
+    out.columns = [col, 'Count']
+    return out
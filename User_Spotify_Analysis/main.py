@@ -1,9 +1,12 @@
 import streamlit as st
-import pandas as pd
-import plotly.graph_objects as go
-import plotly.express as px
 from pathlib import Path
-import json
+import sys
+
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+import rerun_profiler
+
+# pandas and plotly are imported once a file is uploaded, so the landing
+# page never waits on them.
 
 # ─────────────────────────────────────────────
 # THEME & STYLING
@@ -15,16 +18,17 @@ st.set_page_config(
     initial_sidebar_state="collapsed",
 )
 
-GREEN = "#1DB954"
-GREEN_DARK = "#158a3e"
-BG_DARK = "#0f0f0f"
-CARD_BG = "#1a1a1a"
-CARD_BORDER = "#2a2a2a"
-TEXT_PRIMARY = "#ffffff"
-TEXT_SECONDARY = "#a8a8a8"
-TEXT_MUTED = "#6b6b6b"
+with rerun_profiler.profile("user_spotify_analysis") as prof:
+    GREEN = "#1DB954"
+    GREEN_DARK = "#158a3e"
+    BG_DARK = "#0f0f0f"
+    CARD_BG = "#1a1a1a"
+    CARD_BORDER = "#2a2a2a"
+    TEXT_PRIMARY = "#ffffff"
+    TEXT_SECONDARY = "#a8a8a8"
+    TEXT_MUTED = "#6b6b6b"
 
-st.markdown(f"""
+    st.markdown(f"""
 <style>
     /* ── Base ── */
     .stApp {{
@@ -187,133 +191,110 @@ st.markdown(f"""
 """, unsafe_allow_html=True)
 
 
-# ─────────────────────────────────────────────
-# DATA LOADING
-# ─────────────────────────────────────────────
-@st.cache_data
-def load_and_clean(raw_bytes: bytes) -> pd.DataFrame:
-    data = json.loads(raw_bytes.decode("utf-8"))
-    df = pd.DataFrame(data)
-
-    drop_cols = [
-        c for c in [
-            'reason_start','reason_end','ip_addr','shuffle','skipped',
-            'offline','offline_timestamp','incognito_mode','episode_name',
-            'audiobook_uri','audiobook_chapter_uri','spotify_track_uri',
-            'episode_show_name','spotify_episode_uri','audiobook_title',
-            'audiobook_chapter_title'
-        ] if c in df.columns
-    ]
-    df.drop(columns=drop_cols, inplace=True, errors="ignore")
-
-    rename_map = {
-        'conn_country': 'Country',
-        'master_metadata_album_artist_name': 'Artist',
-        'master_metadata_track_name': 'Track',
-        'master_metadata_album_album_name': 'Album',
-    }
-    df.rename(columns={k: v for k, v in rename_map.items() if k in df.columns}, inplace=True)
-
-    df['minutes_played'] = df['ms_played'] / 60000
-    df.drop(columns=['ms_played'], inplace=True, errors="ignore")
-    df['ts'] = pd.to_datetime(df['ts'])
-    df['Year'] = df['ts'].dt.year
-    df['Hour'] = df['ts'].dt.hour
-    df['Day'] = df['ts'].dt.day_name()
-    df['platform'] = df['platform'].fillna('Unknown') if 'platform' in df.columns else 'Unknown'
-    return df
-
-
-# ─────────────────────────────────────────────
-# PLOTLY DEFAULTS
-# ─────────────────────────────────────────────
-def base_layout(**kwargs):
-    # pull axis overrides safely
-    xaxis_custom = kwargs.pop("xaxis", {})
-    yaxis_custom = kwargs.pop("yaxis", {})
-
-    # base axis configs
-    xaxis_cfg = {
-        "showgrid": False,
-        "showline": False,
-        "title_font": dict(color=TEXT_MUTED, size=11),
-    }
-    yaxis_cfg = {
-        "showgrid": True,
-        "gridcolor": "#2a2a2a",
-        "showline": False,
-        "title_font": dict(color=TEXT_MUTED, size=11),
-    }
-
-    # override safely (NO duplicate keys)
-    xaxis_cfg.update(xaxis_custom)
-    yaxis_cfg.update(yaxis_custom)
-
-    return go.Layout(
-        paper_bgcolor="rgba(0,0,0,0)",
-        plot_bgcolor="rgba(0,0,0,0)",
-        font=dict(color=TEXT_SECONDARY, size=11),
-        margin=dict(l=16, r=16, t=40, b=40),
-
-        xaxis=xaxis_cfg,
-        yaxis=yaxis_cfg,
-
-        hovermode="x unified",
-        hoverlabel=dict(
-            bgcolor=CARD_BG,
-            bordercolor=CARD_BORDER,
-            font=dict(size=12, color=TEXT_PRIMARY),
-        ),
-
-        **kwargs
-    )
-
-
-
-def chart_wrap(fig):
-    st.markdown('<div class="plotly-chart">', unsafe_allow_html=True)
-    st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
-    st.markdown('</div>', unsafe_allow_html=True)
-
-
-# ─────────────────────────────────────────────
-# APP ENTRY
-# ─────────────────────────────────────────────
-
-# ── Header ──
-st.markdown("""
+    # ─────────────────────────────────────────────
+    # DATA LOADING
+    # ─────────────────────────────────────────────
+    @st.cache_data(show_spinner="Parsing your streaming history…")
+    @rerun_profiler.track_cache("load_and_clean")
+    def load_and_clean(raw_bytes: bytes):
+        import spotify_data
+        return spotify_data.load_and_clean(raw_bytes)
+
+
+    # ─────────────────────────────────────────────
+    # PLOTLY DEFAULTS
+    # ─────────────────────────────────────────────
+    def base_layout(**kwargs):
+        # pull axis overrides safely
+        xaxis_custom = kwargs.pop("xaxis", {})
+        yaxis_custom = kwargs.pop("yaxis", {})
+
+        # base axis configs
+        xaxis_cfg = {
+            "showgrid": False,
+            "showline": False,
+            "title_font": dict(color=TEXT_MUTED, size=11),
+        }
+        yaxis_cfg = {
+            "showgrid": True,
+            "gridcolor": "#2a2a2a",
+            "showline": False,
+            "title_font": dict(color=TEXT_MUTED, size=11),
+        }
+
+        # override safely (NO duplicate keys)
+        xaxis_cfg.update(xaxis_custom)
+        yaxis_cfg.update(yaxis_custom)
+
+        return go.Layout(
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(0,0,0,0)",
+            font=dict(color=TEXT_SECONDARY, size=11),
+            margin=dict(l=16, r=16, t=40, b=40),
+
+            xaxis=xaxis_cfg,
+            yaxis=yaxis_cfg,
+
+            hovermode="x unified",
+            hoverlabel=dict(
+                bgcolor=CARD_BG,
+                bordercolor=CARD_BORDER,
+                font=dict(size=12, color=TEXT_PRIMARY),
+            ),
+
+            **kwargs
+        )
+
+
+
+    def chart_wrap(fig):
+        st.markdown('<div class="plotly-chart">', unsafe_allow_html=True)
+        st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+    # ─────────────────────────────────────────────
+    # APP ENTRY
+    # ─────────────────────────────────────────────
+
+    # ── Header ──
+    st.markdown("""
 <div class="header-wrap">
   <h1><span class="green-dot"></span>Spotify Listening Insights</h1>
   <p>Upload your Spotify streaming history JSON to explore your listening patterns</p>
 </div>
 """, unsafe_allow_html=True)
 
-# ── Upload ──
-uploaded = st.file_uploader(
-    "Drop your Streaming History Audio JSON file here",
-    type=["json"],
-    label_visibility="visible",
-)
+    # ── Upload ──
+    uploaded = st.file_uploader(
+        "Drop your Streaming History Audio JSON file here",
+        type=["json"],
+        label_visibility="visible",
+    )
 
-if not uploaded:
-    st.markdown(f"""
+    if not uploaded:
+        st.markdown(f"""
     <div style="margin-top:3rem; text-align:center; color:{TEXT_MUTED}; font-size:0.85rem;">
         👆 Upload your <b style="color:{TEXT_SECONDARY}">Streaming_History_Audio.json</b> file above to get started.
     </div>
     """, unsafe_allow_html=True)
-else:
-  # ── Load ──
-  df = load_and_clean(uploaded.getvalue())
-
-  # ─────────────────────────────────────────────
-  # KPI CARDS
-  # ─────────────────────────────────────────────
-  total_min = df['minutes_played'].sum()
-  total_tracks = len(df)
-  active_days = df['ts'].dt.date.nunique()
-  avg_per_day = total_min / max(active_days, 1)
-
-  st.markdown(f"""
+    else:
+      import plotly.graph_objects as go
+
+      # ── Load ──
+      with prof.section("load_and_clean"), prof.cache_lookup("load_and_clean"):
+          df = load_and_clean(uploaded.getvalue())
+
+      # ─────────────────────────────────────────────
+      # KPI CARDS
+      # ─────────────────────────────────────────────
+      with prof.section("kpis"):
+          total_min = df['minutes_played'].sum()
+          total_tracks = len(df)
+          active_days = df['ts'].dt.date.nunique()
+          avg_per_day = total_min / max(active_days, 1)
+
+      st.markdown(f"""
   <div class="stat-row">
     <div class="stat-card">
       <div class="stat-label">Total Hours</div>
@@ -338,161 +319,169 @@ else:
   </div>
   """, unsafe_allow_html=True)
 
-  # ─────────────────────────────────────────────
-  # ROW 1 — Tracks by Year  |  Platform Split
-  # ─────────────────────────────────────────────
-  col1, col2 = st.columns([3, 2], gap="medium")
-
-  with col1:
-      st.markdown('<div class="section-title"><span class="green-dot"></span>Tracks by Year</div>', unsafe_allow_html=True)
-      yc = df['Year'].value_counts().sort_index()
-      fig = go.Figure(
-          data=[go.Bar(
-              x=yc.index.astype(str), y=yc.values,
-              marker_color=GREEN,
-              marker_line=dict(color=GREEN_DARK, width=1),
-              text=yc.values, textposition="outside",
-              textfont=dict(color=TEXT_SECONDARY, size=11),
-              hovertemplate="<b>%{x}</b><br>%{y:,} tracks<extra></extra>",
-          )],
-          layout=base_layout(title_text="", yaxis_title="Tracks")
-      )
-      chart_wrap(fig)
-
-  with col2:
-      st.markdown('<div class="section-title"><span class="green-dot"></span>Platform Distribution</div>', unsafe_allow_html=True)
-      pc = df['platform'].value_counts()
-      colors_pie = [GREEN, "#158a3e", "#0e6b2f", "#a8a8a8", "#6b6b6b"]
-      fig = go.Figure(
-          data=[go.Pie(
-              labels=pc.index, values=pc.values,
-              marker_colors=colors_pie[:len(pc)],
-              textinfo="label+percent",
-              textfont=dict(color=TEXT_PRIMARY, size=11),
-              hovertemplate="<b>%{label}</b><br>%{value:,} plays (%{percent})<extra></extra>",
-              hole=0.4,
-          )],
-          layout=go.Layout(
-              paper_bgcolor="rgba(0,0,0,0)",
-              plot_bgcolor="rgba(0,0,0,0)",
-              margin=dict(l=16, r=16, t=10, b=10),
-              showlegend=False,
-              font=dict(color=TEXT_SECONDARY, size=11),
-              hoverlabel=dict(bgcolor=CARD_BG, bordercolor=CARD_BORDER, font=dict(size=12, color=TEXT_PRIMARY)),
-          )
-      )
-      chart_wrap(fig)
-
-  # ─────────────────────────────────────────────
-  # ROW 2 — Top Artists  |  Top Albums  |  Top Tracks
-  # ─────────────────────────────────────────────
-  TOP_N = 15
-  top_artists = df['Artist'].value_counts().head(TOP_N)
-  top_albums = df['Album'].value_counts().head(TOP_N)
-  top_tracks = df['Track'].value_counts().head(TOP_N)
-
-  tabs = st.tabs(["🎤 Top Artists", "💿 Top Albums", "🎵 Top Tracks"])
-
-  for tab, series, title in zip(tabs, [top_artists, top_albums, top_tracks],
-                                 ["Artists", "Albums", "Tracks"]):
-      with tab:
-          # Truncate long labels for chart, keep original for hover
-          max_len = 28
-          short = series.index.map(lambda x: (x[:max_len] + "…") if len(str(x)) > max_len else x)
-          fig = go.Figure(
-              data=[go.Bar(
-                  y=short[::-1], x=series.values[::-1],
-                  orientation="h",
-                  marker_color=[GREEN if i == 0 else "#2a4a2a" for i in range(len(series))],
-                  text=series.values[::-1],
-                  textposition="outside",
-                  textfont=dict(color=TEXT_SECONDARY, size=10),
-                  customdata=series.index[::-1],
-                  hovertemplate="<b>%{customdata}</b><br>%{x:,} plays<extra></extra>",
-              )],
-              layout=base_layout(
-                  title_text=f"Top {TOP_N} {title}",
-                  title_font=dict(color=TEXT_PRIMARY, size=13),
-                  xaxis=dict(showgrid=True, gridcolor="#2a2a2a", showline=False, title_text="Plays"),
-                  yaxis=dict(showgrid=False, showline=False, tickfont=dict(size=10.5, color=TEXT_SECONDARY)),
-                  height=480,
-                  bargap=0.3,
+      # ─────────────────────────────────────────────
+      # ROW 1 — Tracks by Year  |  Platform Split
+      # ─────────────────────────────────────────────
+      col1, col2 = st.columns([3, 2], gap="medium")
+
+      with col1:
+          st.markdown('<div class="section-title"><span class="green-dot"></span>Tracks by Year</div>', unsafe_allow_html=True)
+          with prof.section("fig_tracks_by_year"):
+              yc = df['Year'].value_counts().sort_index()
+              fig = go.Figure(
+                  data=[go.Bar(
+                      x=yc.index.astype(str), y=yc.values,
+                      marker_color=GREEN,
+                      marker_line=dict(color=GREEN_DARK, width=1),
+                      text=yc.values, textposition="outside",
+                      textfont=dict(color=TEXT_SECONDARY, size=11),
+                      hovertemplate="<b>%{x}</b><br>%{y:,} tracks<extra></extra>",
+                  )],
+                  layout=base_layout(title_text="", yaxis_title="Tracks")
               )
-          )
-          chart_wrap(fig)
-
-  # ─────────────────────────────────────────────
-  # ROW 3 — Hourly Activity  |  Weekly Patterns
-  # ─────────────────────────────────────────────
-  col1, col2 = st.columns(2, gap="medium")
-
-  with col1:
-      st.markdown('<div class="section-title"><span class="green-dot"></span>Hourly Listening</div>', unsafe_allow_html=True)
-      hourly = df['Hour'].value_counts().sort_index()
-      peak_h = hourly.idxmax()
-      fig = go.Figure(
-          data=[go.Bar(
-              x=[f"{h:02d}:00" for h in hourly.index],
-              y=hourly.values,
-              marker_color=[GREEN if h == peak_h else "#2a4a2a" for h in hourly.index],
-              hovertemplate="<b>%{x}</b><br>%{y:,} plays<extra></extra>",
-          )],
-          layout=base_layout(title_text="", xaxis_title="Hour", yaxis_title="Plays",
-                             xaxis_tickfont=dict(size=9))
-      )
-      chart_wrap(fig)
-
-  with col2:
-      st.markdown('<div class="section-title"><span class="green-dot"></span>Weekly Patterns</div>', unsafe_allow_html=True)
-      day_order = ['Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday']
-      weekly = df['Day'].value_counts().reindex(day_order).fillna(0).astype(int)
-      peak_d = weekly.idxmax()
-      fig = go.Figure(
-          data=[go.Bar(
-              x=weekly.index, y=weekly.values,
-              marker_color=[GREEN if d == peak_d else "#2a4a2a" for d in weekly.index],
-              hovertemplate="<b>%{x}</b><br>%{y:,} plays<extra></extra>",
-          )],
-          layout=base_layout(title_text="", xaxis_title="Day", yaxis_title="Plays",
-                             xaxis_tickfont=dict(size=9.5))
-      )
-      chart_wrap(fig)
-
-  # ─────────────────────────────────────────────
-  # ROW 4 — Discovery Rate
-  # ─────────────────────────────────────────────
-  st.markdown('<div class="section-title"><span class="green-dot"></span>Discovery Rate</div>', unsafe_allow_html=True)
-
-  current_year = df['Year'].max()
-  df['IsNew'] = df['Year'] >= (current_year - 1)
-  new_ct = int(df['IsNew'].sum())
-  old_ct = int((~df['IsNew']).sum())
-  new_pct = new_ct / total_tracks * 100
-
-  col1, col2 = st.columns([1, 3], gap="medium")
-
-  with col1:
-      fig = go.Figure(
-          data=[go.Pie(
-              labels=["New Releases", "Older Tracks"],
-              values=[new_ct, old_ct],
-              marker_colors=[GREEN, "#2a2a2a"],
-              textinfo="percent",
-              textfont=dict(color=TEXT_PRIMARY, size=13, family="sans-serif"),
-              hovertemplate="<b>%{label}</b><br>%{value:,} (%{percent})<extra></extra>",
-              hole=0.5,
-          )],
-          layout=go.Layout(
-              paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
-              margin=dict(l=0, r=0, t=10, b=10), showlegend=False,
-              font=dict(color=TEXT_SECONDARY),
-              hoverlabel=dict(bgcolor=CARD_BG, bordercolor=CARD_BORDER, font=dict(size=12, color=TEXT_PRIMARY)),
-          )
-      )
-      chart_wrap(fig)
-
-  with col2:
-      st.markdown(f"""
+              chart_wrap(fig)
+
+      with col2:
+          st.markdown('<div class="section-title"><span class="green-dot"></span>Platform Distribution</div>', unsafe_allow_html=True)
+          with prof.section("fig_platform"):
+              pc = df['platform'].value_counts()
+              colors_pie = [GREEN, "#158a3e", "#0e6b2f", "#a8a8a8", "#6b6b6b"]
+              fig = go.Figure(
+                  data=[go.Pie(
+                      labels=pc.index, values=pc.values,
+                      marker_colors=colors_pie[:len(pc)],
+                      textinfo="label+percent",
+                      textfont=dict(color=TEXT_PRIMARY, size=11),
+                      hovertemplate="<b>%{label}</b><br>%{value:,} plays (%{percent})<extra></extra>",
+                      hole=0.4,
+                  )],
+                  layout=go.Layout(
+                      paper_bgcolor="rgba(0,0,0,0)",
+                      plot_bgcolor="rgba(0,0,0,0)",
+                      margin=dict(l=16, r=16, t=10, b=10),
+                      showlegend=False,
+                      font=dict(color=TEXT_SECONDARY, size=11),
+                      hoverlabel=dict(bgcolor=CARD_BG, bordercolor=CARD_BORDER, font=dict(size=12, color=TEXT_PRIMARY)),
+                  )
+              )
+              chart_wrap(fig)
+
+      # ─────────────────────────────────────────────
+      # ROW 2 — Top Artists  |  Top Albums  |  Top Tracks
+      # ─────────────────────────────────────────────
+      TOP_N = 15
+      with prof.section("top_n_counts"):
+          top_artists = df['Artist'].value_counts().head(TOP_N)
+          top_albums = df['Album'].value_counts().head(TOP_N)
+          top_tracks = df['Track'].value_counts().head(TOP_N)
+
+      tabs = st.tabs(["🎤 Top Artists", "💿 Top Albums", "🎵 Top Tracks"])
+
+      for tab, series, title in zip(tabs, [top_artists, top_albums, top_tracks],
+                                     ["Artists", "Albums", "Tracks"]):
+          with tab:
+              # Truncate long labels for chart, keep original for hover
+              with prof.section(f"fig_top_{title.lower()}"):
+                  max_len = 28
+                  short = series.index.map(lambda x: (x[:max_len] + "…") if len(str(x)) > max_len else x)
+                  fig = go.Figure(
+                      data=[go.Bar(
+                          y=short[::-1], x=series.values[::-1],
+                          orientation="h",
+                          marker_color=[GREEN if i == 0 else "#2a4a2a" for i in range(len(series))],
+                          text=series.values[::-1],
+                          textposition="outside",
+                          textfont=dict(color=TEXT_SECONDARY, size=10),
+                          customdata=series.index[::-1],
+                          hovertemplate="<b>%{customdata}</b><br>%{x:,} plays<extra></extra>",
+                      )],
+                      layout=base_layout(
+                          title_text=f"Top {TOP_N} {title}",
+                          title_font=dict(color=TEXT_PRIMARY, size=13),
+                          xaxis=dict(showgrid=True, gridcolor="#2a2a2a", showline=False, title_text="Plays"),
+                          yaxis=dict(showgrid=False, showline=False, tickfont=dict(size=10.5, color=TEXT_SECONDARY)),
+                          height=480,
+                          bargap=0.3,
+                      )
+                  )
+                  chart_wrap(fig)
+
+      # ─────────────────────────────────────────────
+      # ROW 3 — Hourly Activity  |  Weekly Patterns
+      # ─────────────────────────────────────────────
+      col1, col2 = st.columns(2, gap="medium")
+
+      with col1:
+          st.markdown('<div class="section-title"><span class="green-dot"></span>Hourly Listening</div>', unsafe_allow_html=True)
+          with prof.section("fig_hourly"):
+              hourly = df['Hour'].value_counts().sort_index()
+              peak_h = hourly.idxmax()
+              fig = go.Figure(
+                  data=[go.Bar(
+                      x=[f"{h:02d}:00" for h in hourly.index],
+                      y=hourly.values,
+                      marker_color=[GREEN if h == peak_h else "#2a4a2a" for h in hourly.index],
+                      hovertemplate="<b>%{x}</b><br>%{y:,} plays<extra></extra>",
+                  )],
+                  layout=base_layout(title_text="", xaxis_title="Hour", yaxis_title="Plays",
+                                     xaxis_tickfont=dict(size=9))
+              )
+              chart_wrap(fig)
+
+      with col2:
+          st.markdown('<div class="section-title"><span class="green-dot"></span>Weekly Patterns</div>', unsafe_allow_html=True)
+          day_order = ['Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday']
+          with prof.section("fig_weekly"):
+              weekly = df['Day'].value_counts().reindex(day_order).fillna(0).astype(int)
+              peak_d = weekly.idxmax()
+              fig = go.Figure(
+                  data=[go.Bar(
+                      x=weekly.index, y=weekly.values,
+                      marker_color=[GREEN if d == peak_d else "#2a4a2a" for d in weekly.index],
+                      hovertemplate="<b>%{x}</b><br>%{y:,} plays<extra></extra>",
+                  )],
+                  layout=base_layout(title_text="", xaxis_title="Day", yaxis_title="Plays",
+                                     xaxis_tickfont=dict(size=9.5))
+              )
+              chart_wrap(fig)
+
+      # ─────────────────────────────────────────────
+      # ROW 4 — Discovery Rate
+      # ─────────────────────────────────────────────
+      st.markdown('<div class="section-title"><span class="green-dot"></span>Discovery Rate</div>', unsafe_allow_html=True)
+
+      with prof.section("discovery_rate"):
+          current_year = df['Year'].max()
+          df['IsNew'] = df['Year'] >= (current_year - 1)
+          new_ct = int(df['IsNew'].sum())
+          old_ct = int((~df['IsNew']).sum())
+          new_pct = new_ct / total_tracks * 100
+
+      col1, col2 = st.columns([1, 3], gap="medium")
+
+      with col1:
+          with prof.section("fig_discovery"):
+              fig = go.Figure(
+                  data=[go.Pie(
+                      labels=["New Releases", "Older Tracks"],
+                      values=[new_ct, old_ct],
+                      marker_colors=[GREEN, "#2a2a2a"],
+                      textinfo="percent",
+                      textfont=dict(color=TEXT_PRIMARY, size=13, family="sans-serif"),
+                      hovertemplate="<b>%{label}</b><br>%{value:,} (%{percent})<extra></extra>",
+                      hole=0.5,
+                  )],
+                  layout=go.Layout(
+                      paper_bgcolor="rgba(0,0,0,0)", plot_bgcolor="rgba(0,0,0,0)",
+                      margin=dict(l=0, r=0, t=10, b=10), showlegend=False,
+                      font=dict(color=TEXT_SECONDARY),
+                      hoverlabel=dict(bgcolor=CARD_BG, bordercolor=CARD_BORDER, font=dict(size=12, color=TEXT_PRIMARY)),
+                  )
+              )
+              chart_wrap(fig)
+
+      with col2:
+          st.markdown(f"""
       <div style="display:flex; gap:2rem; align-items:center; height:100%; padding-top:1rem;">
         <div style="background:{CARD_BG}; border:1px solid {CARD_BORDER}; border-radius:12px; padding:1.4rem 1.8rem; flex:1;">
           <div style="font-size:0.7rem; text-transform:uppercase; letter-spacing:1.2px; color:{TEXT_MUTED};">New Releases <span style="color:{GREEN}">&lt; 1 yr</span></div>
@@ -507,10 +496,10 @@ else:
       </div>
       """, unsafe_allow_html=True)
 
-  # ─────────────────────────────────────────────
-  # FOOTER
-  # ─────────────────────────────────────────────
-  st.markdown(f"""
+      # ─────────────────────────────────────────────
+      # FOOTER
+      # ─────────────────────────────────────────────
+      st.markdown(f"""
   <div style="margin-top:3rem; padding-top:1.2rem; border-top:1px solid {CARD_BORDER};
        text-align:center; color:{TEXT_MUTED}; font-size:0.72rem;">
     Spotify Listening Insights &nbsp;·&nbsp; Built with Streamlit &nbsp;·&nbsp; Data covers {df['Year'].min()}–{df['Year'].max()}
@@ -0,0 +1,38 @@
+import json
+
+import pandas as pd
+
+DROP_COLS = [
+    'reason_start','reason_end','ip_addr','shuffle','skipped',
+    'offline','offline_timestamp','incognito_mode','episode_name',
+    'audiobook_uri','audiobook_chapter_uri','spotify_track_uri',
+    'episode_show_name','spotify_episode_uri','audiobook_title',
+    'audiobook_chapter_title'
+]
+
+RENAME_MAP = {
+    'conn_country': 'Country',
+    'master_metadata_album_artist_name': 'Artist',
+    'master_metadata_track_name': 'Track',
+    'master_metadata_album_album_name': 'Album',
+}
+
+
+def load_and_clean(raw_bytes: bytes) -> pd.DataFrame:
+    """Parse a Streaming History Audio JSON export into the frame the app charts."""
+    data = json.loads(raw_bytes.decode("utf-8"))
+    df = pd.DataFrame(data)
+
+    drop_cols = [c for c in DROP_COLS if c in df.columns]
+    df.drop(columns=drop_cols, inplace=True, errors="ignore")
+
+    df.rename(columns={k: v for k, v in RENAME_MAP.items() if k in df.columns}, inplace=True)
+
+    df['minutes_played'] = df['ms_played'] / 60000
+    df.drop(columns=['ms_played'], inplace=True, errors="ignore")
+    df['ts'] = pd.to_datetime(df['ts'])
+    df['Year'] = df['ts'].dt.year
+    df['Hour'] = df['ts'].dt.hour
+    df['Day'] = df['ts'].dt.day_name()
+    df['platform'] = df['platform'].fillna('Unknown') if 'platform' in df.columns else 'Unknown'
+    return df
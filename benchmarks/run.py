@@ -0,0 +1,293 @@
+"""Headless benchmarks for the data paths of the three apps.
+
+    python benchmarks/run.py --scale 10k 1m
+    python benchmarks/run.py --scale 10k --save-baseline
+    python benchmarks/run.py --scale 10k --fail-over 20
+
+Each case is timed ``--repeat`` times (the median is reported) and then run
+once more under tracemalloc for its peak memory. That peak is what this
+process traces: Arrow-backed string buffers live outside the Python
+allocator and are not counted.
+
+``train_model`` is too slow for that and its GridSearchCV workers run in
+child processes, so it runs once and reports the RSS high-water mark of
+this process and its workers instead (marked ``*``, Unix only). That is a
+peak over the whole run so far, not just the case.
+Missing inputs are generated with ``benchmarks/synthetic.py``.
+
+Only the datasets the selected ``--cases`` read are generated. The 10m
+Spotify case is skipped unless ``--allow-huge-spotify`` is passed: its input
+is a ~6 GB JSON file that ``load_and_clean`` reads and parses whole, as the
+app does, which needs several times that in RAM.
+
+Results are compared against ``benchmarks/baselines.json`` (keyed by
+``case@scale``) when an entry exists. Baselines are machine specific, so
+save them on the machine you compare on.
+"""
+import argparse
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+HERE = Path(__file__).resolve().parent
+ROOT = HERE.parent
+for app in ("User_Spotify_Analysis", "Sales_Analytics_Dashboard", "House_Price_Predictor"):
+    sys.path.append(str(ROOT / app))
+sys.path.append(str(HERE))
+
+import pandas as pd
+
+import housing_model
+import sales_data
+import spotify_data
+import synthetic
+
+BASELINES = HERE / "baselines.json"
+
+# The app predicts from plain lists, exactly like predict_single does here.
+warnings.filterwarnings("ignore", message="X does not have valid feature names")
+
+
+# ─────────────────────────────────────────────
+# CASES
+# ─────────────────────────────────────────────
+# Each case takes (paths, state, opts) and returns (rows, setup, run):
+# setup() builds fresh arguments untimed, run(*args) is what gets timed.
+
+def spotify_load_and_clean(paths, state, opts):
+    raw = Path(paths["spotify"]).read_bytes()
+    rows = len(spotify_data.load_and_clean(raw))  # doubles as a warm-up run
+    return rows, lambda: (raw,), spotify_data.load_and_clean
+
+
+def _load_sales(path):
+    # Mirrors the app's cached load_sales(), which parses the dates once.
+    return sales_data.add_month(sales_data.load(path))
+
+
+def _sales_frame(paths, state):
+    if "sales" not in state:
+        state["sales"] = _load_sales(paths["sales"])
+    return state["sales"]
+
+
+def sales_read_csv(paths, state, opts):
+    df = _sales_frame(paths, state)
+    return len(df), lambda: (paths["sales"],), _load_sales
+
+
+def _sales_groupbys(df):
+    # What the dashboard recomputes on every rerun.
+    sales_data.total_by(df, 'Product_Category')
+    sales_data.total_by(df, 'Region')
+    sales_data.monthly_totals(df)
+    sales_data.monthly_totals_by(df, 'Product_Category')
+    sales_data.monthly_totals_by(df, 'Region')
+    sales_data.top_sales_reps(df, 10)
+    sales_data.counts(df, 'Customer_Type')
+    sales_data.counts(df, 'Payment_Method')
+
+
+def sales_groupbys(paths, state, opts):
+    df = _sales_frame(paths, state)
+    return len(df), lambda: (df,), _sales_groupbys
+
+
+def _housing_frame(paths, state, opts):
+    if "housing" not in state:
+        df = pd.read_csv(paths["housing"])
+        if opts.max_train_rows and len(df) > opts.max_train_rows:
+            df = df.sample(opts.max_train_rows, random_state=0)
+        state["housing"] = df
+    return state["housing"]
+
+
+def _fitted_model(paths, state, opts):
+    if "model" not in state:
+        state["model"] = housing_model.train_model(_housing_frame(paths, state, opts))
+    return state["model"]
+
+
+def housing_train_model(paths, state, opts):
+    df = _housing_frame(paths, state, opts)
+
+    def run(frame):
+        state["model"] = housing_model.train_model(frame)
+
+    return len(df), lambda: (df,), run
+
+
+def housing_predict_single(paths, state, opts):
+    model = _fitted_model(paths, state, opts)
+    df = _housing_frame(paths, state, opts)
+    row = housing_model.encode(df.head(1))[housing_model.features_for(df)]
+    return 1, lambda: (model, row.values.tolist()), housing_model.predict_prices
+
+
+def housing_predict_batch(paths, state, opts):
+    model = _fitted_model(paths, state, opts)
+    full = pd.read_csv(paths["housing"])
+    X = housing_model.encode(full)[housing_model.features_for(full)]
+    return len(X), lambda: (model, X), housing_model.predict_prices
+
+
+CASES = {
+    "spotify.load_and_clean": spotify_load_and_clean,
+    "sales.read_csv": sales_read_csv,
+    "sales.groupbys": sales_groupbys,
+    "housing.train_model": housing_train_model,
+    "housing.predict_single": housing_predict_single,
+    "housing.predict_batch": housing_predict_batch,
+}
+
+# Cases too slow to repeat at scale. They are also not rerun under
+# tracemalloc: that would double the cost and still miss the worker
+# processes, so they report peak RSS instead.
+SINGLE_SHOT = {"housing.train_model"}
+
+# Inputs too large to load whole on an ordinary machine.
+HUGE = {"spotify.load_and_clean@10m"}
+
+
+def dataset_of(case: str) -> str:
+    return case.split(".")[0]
+
+
+# ─────────────────────────────────────────────
+# RUNNER
+# ─────────────────────────────────────────────
+def rss_peak_mib():
+    """RSS high-water mark of this process and its reaped children, or None."""
+    if resource is None:
+        return None
+    # Loky keeps GridSearchCV's workers alive for reuse, and they only count
+    # towards RUSAGE_CHILDREN once they have exited and been waited for.
+    from joblib.externals.loky import get_reusable_executor
+    get_reusable_executor().shutdown(wait=True)
+    unit = 1 if sys.platform == "darwin" else 1024  # ru_maxrss is bytes on macOS, KiB on Linux
+    peak = max(resource.getrusage(who).ru_maxrss
+               for who in (resource.RUSAGE_SELF, resource.RUSAGE_CHILDREN))
+    return peak * unit / 2**20
+
+
+def measure(setup, run, repeat: int, memory: str) -> dict:
+    """Time ``repeat`` runs. ``memory`` is "traced", "rss" or None."""
+    times = []
+    for _ in range(repeat):
+        args = setup()
+        t0 = time.perf_counter()
+        run(*args)
+        times.append(time.perf_counter() - t0)
+
+    peak_mib = None
+    if memory == "rss":
+        peak_mib = rss_peak_mib()
+    elif memory == "traced":
+        args = setup()
+        tracemalloc.start()
+        try:
+            run(*args)
+            peak_mib = tracemalloc.get_traced_memory()[1] / 2**20
+        finally:
+            tracemalloc.stop()
+
+    return {"seconds": statistics.median(times), "peak_mib": peak_mib,
+            "peak_kind": memory if peak_mib is not None else None}
+
+
+def load_baselines() -> dict:
+    if BASELINES.exists():
+        return json.loads(BASELINES.read_text())
+    return {}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", nargs="+", choices=synthetic.SCALES, default=["10k"])
+    parser.add_argument("--cases", nargs="+", choices=CASES, default=list(CASES))
+    parser.add_argument("--data", default=HERE / "data", help="directory of generated inputs")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="skip the memory measurements")
+    parser.add_argument("--max-train-rows", type=int, default=20_000,
+                        help="sample the housing table down to this many rows before training (0 = no cap)")
+    parser.add_argument("--allow-huge-spotify", action="store_true",
+                        help="run spotify.load_and_clean at 10m (~6 GB of JSON, loaded whole)")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--fail-over", type=float, metavar="PCT",
+                        help="exit 1 if any case is more than PCT%% slower than its baseline")
+    parser.add_argument("--json", help="also write results to this file")
+    args = parser.parse_args(argv)
+    if args.repeat < 1:
+        parser.error("--repeat must be at least 1")
+
+    baselines = load_baselines()
+    results = {}
+    regressions = []
+
+    print(f"{'case':<26} {'scale':>5} {'rows':>10} {'seconds':>10} {'rows/s':>12} {'peak MiB':>9} {'vs base':>8}")
+    for scale in args.scale:
+        cases = [c for c in args.cases if args.allow_huge_spotify or f"{c}@{scale}" not in HUGE]
+        for skipped in sorted(set(args.cases) - set(cases)):
+            print(f"skipping {skipped}@{scale}; pass --allow-huge-spotify to run it", file=sys.stderr)
+
+        paths = synthetic.paths_for(args.data, scale)
+        missing = [d for d in synthetic.DATASETS
+                   if any(dataset_of(c) == d for c in cases) and not paths[d].exists()]
+        if missing:
+            synthetic.generate(args.data, scale, datasets=missing)
+
+        state = {}
+        for name in cases:
+            rows, setup, run = CASES[name](paths, state, args)
+            single = name in SINGLE_SHOT
+            memory = None if args.no_memory else "rss" if single else "traced"
+            res = measure(setup, run, 1 if single else args.repeat, memory)
+            res["rows"] = rows
+            res["rows_per_s"] = rows / res["seconds"] if res["seconds"] else None
+
+            key = f"{name}@{scale}"
+            results[key] = res
+
+            delta = ""
+            base = baselines.get(key)
+            if base:
+                change = (res["seconds"] / base["seconds"] - 1) * 100
+                delta = f"{change:+.0f}%"
+                if args.fail_over is not None and change > args.fail_over:
+                    regressions.append(f"{key}: {change:+.1f}%")
+
+            peak = "-"
+            if res["peak_mib"] is not None:
+                peak = f"{res['peak_mib']:.1f}" + ("*" if res["peak_kind"] == "rss" else "")
+            print(f"{name:<26} {scale:>5} {rows:>10,} {res['seconds']:>10.4f} "
+                  f"{res['rows_per_s'] or 0:>12,.0f} {peak:>9} {delta:>8}")
+
+    if any(r["peak_kind"] == "rss" for r in results.values()):
+        print("* peak RSS of the benchmark process and its workers, not traced allocations")
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(results, indent=2))
+
+    if args.save_baseline:
+        baselines.update({k: {"seconds": v["seconds"], "peak_mib": v["peak_mib"], "peak_kind": v["peak_kind"]}
+                          for k, v in results.items()})
+        BASELINES.write_text(json.dumps(baselines, indent=2, sort_keys=True) + "\n")
+        print(f"baseline saved to {BASELINES}")
+
+    if regressions:
+        print("regressions over threshold:\n  " + "\n  ".join(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Cold-start report: import time and time to first paint for each app.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --apps Sales_Analytics_Dashboard --runs 5
+
+Every run starts a fresh interpreter with ``-X importtime`` and executes the
+app headlessly with ``streamlit.testing.v1.AppTest``. Streamlit itself is
+imported before the clock starts, as it is in a running server, so:
+
+* first paint  - time until the script sends its first element;
+* full run     - time until the script finishes (includes training);
+* imports      - cumulative import time of modules first imported while
+                 the script ran, with the heavy packages broken out.
+
+The Spotify app is measured on its landing page, since AppTest cannot
+upload a file.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+APPS = ["User_Spotify_Analysis", "Sales_Analytics_Dashboard", "House_Price_Predictor"]
+HEAVY = ["pandas", "numpy", "plotly", "sklearn", "pyarrow"]
+RUN_MARKER = "startup: run begins"
+
+
+def child(app: str, timeout: float):
+    """Run one app once and print its timings as JSON on stdout."""
+    from streamlit.testing.v1 import AppTest
+    try:
+        from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+    except ImportError:  # streamlit < 1.38
+        from streamlit.runtime.scriptrunner.script_run_context import ScriptRunContext
+
+    first_delta = []
+    enqueue = ScriptRunContext.enqueue
+
+    def timed_enqueue(self, msg):
+        if not first_delta and msg.WhichOneof("type") == "delta":
+            first_delta.append(time.perf_counter())
+        return enqueue(self, msg)
+
+    ScriptRunContext.enqueue = timed_enqueue
+
+    os.chdir(ROOT / app)
+    at = AppTest.from_file(str(ROOT / app / "main.py"), default_timeout=timeout)
+    print(RUN_MARKER, file=sys.stderr, flush=True)
+    t0 = time.perf_counter()
+    at.run()
+    total = time.perf_counter() - t0
+
+    print(json.dumps({
+        "first_paint_ms": (first_delta[0] - t0) * 1000 if first_delta else None,
+        "full_run_ms": total * 1000,
+        "exceptions": [str(e.value) for e in at.exception],
+    }))
+
+
+def parse_importtime(stderr: str) -> dict:
+    """Sum cumulative import times logged after the run marker.
+
+    ``imports_ms`` counts only outermost imports. A heavy package is counted
+    wherever it is entered from outside itself, so pandas is found even when
+    it is first pulled in by an app module. Packages nest (pandas includes
+    numpy), so the breakdown overlaps.
+    """
+    lines = stderr.splitlines()
+    if RUN_MARKER in lines:
+        lines = lines[lines.index(RUN_MARKER) + 1:]
+
+    entries = []
+    for line in lines:
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = len(name) - len(name.lstrip()) - 1
+        entries.append((depth, name.strip().split(".")[0], int(cumulative)))
+
+    per_pkg = {pkg: 0 for pkg in HEAVY}
+    total_us = 0
+    # -X importtime logs children before their parent, so walk backwards to
+    # see each import's parent first.
+    stack = []
+    for depth, root, us in reversed(entries):
+        while stack and stack[-1][0] >= depth:
+            stack.pop()
+        parent = stack[-1][1] if stack else None
+        stack.append((depth, root))
+        if depth == 0:
+            total_us += us
+        if root in per_pkg and parent != root:
+            per_pkg[root] += us
+    return {"imports_ms": total_us / 1000, **{f"{p}_ms": us / 1000 for p, us in per_pkg.items()}}
+
+
+def measure(app: str, timeout: float) -> dict:
+    env = {k: v for k, v in os.environ.items() if k not in ("APPS_PROFILE", "APPS_PROFILE_LOG")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", __file__, "--child", app, "--timeout", str(timeout)],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"{app} failed:\n{proc.stderr[-2000:]}")
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result.update(parse_importtime(proc.stderr))
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", nargs="+", choices=APPS, default=APPS)
+    parser.add_argument("--runs", type=int, default=3, help="cold starts per app (median is reported)")
+    parser.add_argument("--timeout", type=float, default=900)
+    parser.add_argument("--json", help="also write results to this file")
+    parser.add_argument("--child", choices=APPS, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child, args.timeout)
+        return 0
+
+    cols = ["first_paint_ms", "full_run_ms", "imports_ms"] + [f"{p}_ms" for p in HEAVY]
+    print(f"{'app':<28}" + "".join(f"{c[:-3]:>13}" for c in cols) + "   (ms, median)")
+
+    report = {}
+    for app in args.apps:
+        runs = [measure(app, args.timeout) for _ in range(args.runs)]
+        errors = {e for r in runs for e in r["exceptions"]}
+        row = {c: statistics.median(r[c] for r in runs) if runs[0][c] is not None else None for c in cols}
+        report[app] = {**row, "runs": args.runs, "exceptions": sorted(errors)}
+        print(f"{app:<28}" + "".join(f"{row[c]:>13,.0f}" if row[c] is not None else f"{'-':>13}" for c in cols))
+        for e in sorted(errors):
+            print(f"  exception: {e}", file=sys.stderr)
+
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
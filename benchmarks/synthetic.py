@@ -0,0 +1,232 @@
+"""Synthetic datasets shaped like the inputs of the three apps.
+
+    python benchmarks/synthetic.py --scale 10k 1m --out benchmarks/data
+
+writes ``spotify_<scale>.json``, ``sales_<scale>.csv`` and
+``housing_<scale>.csv`` for each scale; ``--datasets`` picks a subset.
+Large scales are generated and written in chunks so 10m rows never has to
+sit in memory at once. Mind the Spotify JSON: about 0.6 KB per row, so
+roughly 6 GB at 10m.
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+CHUNK_ROWS = 500_000
+
+
+# ─────────────────────────────────────────────
+# SPOTIFY STREAMING HISTORY
+# ─────────────────────────────────────────────
+PLATFORMS = ["android", "ios", "windows", "osx", "web_player", "cast_to_device"]
+PLATFORM_P = [0.42, 0.25, 0.14, 0.09, 0.06, 0.04]
+COUNTRIES = ["US", "GB", "IN", "DE", "BR", "CA", "AU", "SE"]
+COUNTRY_P = [0.35, 0.15, 0.15, 0.1, 0.08, 0.07, 0.05, 0.05]
+REASONS_START = ["trackdone", "clickrow", "fwdbtn", "playbtn", "appload"]
+REASONS_END = ["trackdone", "endplay", "fwdbtn", "logout", "unexpected-exit"]
+# Evening-heavy listening, quiet small hours.
+HOUR_P = np.array([2, 1, 1, 1, 1, 2, 3, 5, 6, 6, 6, 6, 6, 6, 6, 6, 7, 8, 8, 8, 7, 6, 4, 3], dtype=float)
+HOUR_P /= HOUR_P.sum()
+
+
+def _catalog(n_rows: int, rng: np.random.Generator):
+    """Artist/album/track catalogue sized to the history, with Zipf-like popularity."""
+    n_tracks = int(np.clip(n_rows // 10, 1000, 200_000))
+    n_artists = max(n_tracks // 12, 50)
+    track_artist = rng.integers(0, n_artists, n_tracks)
+    track_album = track_artist * 4 + rng.integers(0, 4, n_tracks)
+    weights = 1.0 / np.arange(1, n_tracks + 1) ** 0.75
+    return {
+        "track": np.array([f"Track {i:06d}" for i in range(n_tracks)], dtype=object),
+        "artist": np.array([f"Artist {a:05d}" for a in track_artist], dtype=object),
+        "album": np.array([f"Album {a:06d}" for a in track_album], dtype=object),
+        "p": weights / weights.sum(),
+    }
+
+
+def spotify_history(n: int, seed=0, catalog=None) -> pd.DataFrame:
+    """Rows with the same keys as Spotify's Streaming_History_Audio export."""
+    rng = np.random.default_rng(seed)
+    catalog = catalog or _catalog(n, rng)
+    pick = rng.choice(len(catalog["p"]), n, p=catalog["p"])
+
+    days = rng.integers(0, 8 * 365, n)
+    seconds = rng.choice(24, n, p=HOUR_P) * 3600 + rng.integers(0, 3600, n)
+    ts = (np.datetime64("2016-01-01T00:00:00") + days.astype("timedelta64[D]")
+          + seconds.astype("timedelta64[s]"))
+
+    skipped = rng.random(n) < 0.22
+    ms_played = np.where(skipped,
+                         rng.integers(500, 30_000, n),
+                         rng.lognormal(np.log(190_000), 0.25, n).astype(np.int64))
+
+    return pd.DataFrame({
+        "ts": np.datetime_as_string(ts, unit="s").astype(object) + "Z",
+        "platform": rng.choice(PLATFORMS, n, p=PLATFORM_P),
+        "ms_played": ms_played,
+        "conn_country": rng.choice(COUNTRIES, n, p=COUNTRY_P),
+        "ip_addr": "0.0.0.0",
+        "master_metadata_track_name": catalog["track"][pick],
+        "master_metadata_album_artist_name": catalog["artist"][pick],
+        "master_metadata_album_album_name": catalog["album"][pick],
+        "spotify_track_uri": "spotify:track:" + pd.Series(pick).astype(str).str.zfill(22).to_numpy(),
+        "episode_name": None,
+        "episode_show_name": None,
+        "spotify_episode_uri": None,
+        "audiobook_title": None,
+        "audiobook_uri": None,
+        "audiobook_chapter_uri": None,
+        "audiobook_chapter_title": None,
+        "reason_start": rng.choice(REASONS_START, n),
+        "reason_end": np.where(skipped, "fwdbtn", rng.choice(REASONS_END, n)),
+        "shuffle": rng.random(n) < 0.4,
+        "skipped": skipped,
+        "offline": rng.random(n) < 0.05,
+        "offline_timestamp": None,
+        "incognito_mode": False,
+    })
+
+
+# ─────────────────────────────────────────────
+# SALES
+# ─────────────────────────────────────────────
+SALES_REPS = ["Alice", "Bob", "Charlie", "David", "Eve"]
+REGIONS = ["North", "South", "East", "West"]
+CATEGORIES = ["Clothing", "Electronics", "Food", "Furniture"]
+PAYMENT_METHODS = ["Bank Transfer", "Cash", "Credit Card"]
+
+
+def sales(n: int, seed=0) -> pd.DataFrame:
+    """Rows matching the columns and (uniform) distributions of sales.csv."""
+    rng = np.random.default_rng(seed)
+    rep = rng.choice(SALES_REPS, n)
+    region = rng.choice(REGIONS, n)
+    unit_cost = rng.uniform(60, 5000, n).round(2)
+    return pd.DataFrame({
+        "Product_ID": rng.integers(1001, 1101, n),
+        "Sale_Date": np.datetime_as_string(
+            np.datetime64("2023-01-01") + rng.integers(0, 365, n).astype("timedelta64[D]"), unit="D"),
+        "Sales_Rep": rep,
+        "Region": region,
+        "Sales_Amount": rng.uniform(100, 10_000, n).round(2),
+        "Quantity_Sold": rng.integers(1, 50, n),
+        "Product_Category": rng.choice(CATEGORIES, n),
+        "Unit_Cost": unit_cost,
+        "Unit_Price": (unit_cost * rng.uniform(1.02, 1.8, n)).round(2),
+        "Customer_Type": rng.choice(["New", "Returning"], n),
+        "Discount": rng.uniform(0, 0.3, n).round(2),
+        "Payment_Method": rng.choice(PAYMENT_METHODS, n),
+        "Sales_Channel": rng.choice(["Online", "Retail"], n),
+        "Region_and_Sales_Rep": np.char.add(np.char.add(region, "-"), rep),
+    })
+
+
+# ─────────────────────────────────────────────
+# HOUSING
+# ─────────────────────────────────────────────
+def housing(n: int, seed=0) -> pd.DataFrame:
+    """Rows matching housing.csv, with price driven by the features plus noise."""
+    rng = np.random.default_rng(seed)
+
+    def yes_no(p):
+        return np.where(rng.random(n) < p, "yes", "no")
+
+    area = np.clip(rng.lognormal(np.log(4800), 0.38, n), 1650, 16200).astype(np.int64)
+    bedrooms = np.clip(rng.poisson(2.9, n), 1, 6)
+    bathrooms = np.clip(1 + rng.poisson(0.29, n), 1, 4)
+    stories = np.clip(rng.poisson(0.8, n) + 1, 1, 4)
+    parking = np.clip(rng.poisson(0.69, n), 0, 3)
+    cols = {
+        "mainroad": yes_no(0.86), "guestroom": yes_no(0.18), "basement": yes_no(0.35),
+        "hotwaterheating": yes_no(0.05), "airconditioning": yes_no(0.32), "prefarea": yes_no(0.23),
+    }
+    furnishing = rng.choice(["furnished", "semi-furnished", "unfurnished"], n, p=[0.26, 0.42, 0.32])
+
+    log_price = (np.log(1_200_000) + 0.4 * np.log(area / 1000) + 0.04 * bedrooms
+                 + 0.17 * bathrooms + 0.07 * stories + 0.05 * parking
+                 + 0.12 * (cols["mainroad"] == "yes") + 0.05 * (cols["guestroom"] == "yes")
+                 + 0.06 * (cols["basement"] == "yes") + 0.1 * (cols["hotwaterheating"] == "yes")
+                 + 0.17 * (cols["airconditioning"] == "yes") + 0.12 * (cols["prefarea"] == "yes")
+                 + 0.08 * (furnishing == "furnished") + rng.normal(0, 0.18, n))
+    price = (np.exp(log_price) / 1000).round() * 1000
+
+    return pd.DataFrame({
+        "price": price.astype(np.int64), "area": area, "bedrooms": bedrooms,
+        "bathrooms": bathrooms, "stories": stories,
+        "mainroad": cols["mainroad"], "guestroom": cols["guestroom"],
+        "basement": cols["basement"], "hotwaterheating": cols["hotwaterheating"],
+        "airconditioning": cols["airconditioning"], "parking": parking,
+        "prefarea": cols["prefarea"], "furnishingstatus": furnishing,
+    })
+
+
+# ─────────────────────────────────────────────
+# WRITERS
+# ─────────────────────────────────────────────
+def _chunks(n: int):
+    for i, start in enumerate(range(0, n, CHUNK_ROWS)):
+        yield i, min(CHUNK_ROWS, n - start)
+
+
+def write_spotify(path, n: int, seed=0):
+    """Stream a single JSON array to ``path``, one chunk of records at a time."""
+    catalog = _catalog(n, np.random.default_rng(seed))
+    with open(path, "w", encoding="utf-8") as fh:
+        fh.write("[")
+        for i, size in _chunks(n):
+            body = spotify_history(size, seed + i, catalog).to_json(orient="records")
+            if i:
+                fh.write(",")
+            fh.write(body[1:-1])
+        fh.write("]")
+
+
+def write_csv(path, make, n: int, seed=0):
+    for i, size in _chunks(n):
+        make(size, seed + i).to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+
+
+WRITERS = {
+    "spotify": write_spotify,
+    "sales": lambda path, n, seed: write_csv(path, sales, n, seed),
+    "housing": lambda path, n, seed: write_csv(path, housing, n, seed),
+}
+DATASETS = list(WRITERS)
+
+
+def paths_for(out_dir, scale: str) -> dict:
+    out_dir = Path(out_dir)
+    return {
+        "spotify": out_dir / f"spotify_{scale}.json",
+        "sales": out_dir / f"sales_{scale}.csv",
+        "housing": out_dir / f"housing_{scale}.csv",
+    }
+
+
+def generate(out_dir, scale: str, seed=0, datasets=DATASETS) -> dict:
+    """Write the requested datasets for ``scale`` and return their paths."""
+    Path(out_dir).mkdir(parents=True, exist_ok=True)
+    paths = paths_for(out_dir, scale)
+    for name in datasets:
+        WRITERS[name](paths[name], SCALES[scale], seed)
+    return {name: paths[name] for name in datasets}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", nargs="+", choices=SCALES, default=["10k"])
+    parser.add_argument("--out", default=Path(__file__).resolve().parent / "data")
+    parser.add_argument("--datasets", nargs="+", choices=DATASETS, default=DATASETS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    for scale in args.scale:
+        for name, path in generate(args.out, scale, args.seed, args.datasets).items():
+            print(f"{scale:>4} {name:<8} {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""Opt-in per-rerun profiling shared by the Streamlit apps in this repo.
+
+Enable it by setting ``APPS_PROFILE=1`` in the environment or by opening an
+app with ``?profile=1`` in the URL. Wrap the script body in::
+
+    with rerun_profiler.profile("my_app") as prof:
+        with prof.section("read_csv"):
+            ...
+
+Each rerun then times every named section and counts cache hits/misses, and
+a "⏱ Profiling" panel is drawn in the sidebar. Set ``APPS_PROFILE_LOG`` to a
+file path to also append one JSON line per rerun there. Reruns cut short by
+a widget interaction or an exception are logged too, with their ``status``.
+
+Peak memory is only recorded when ``APPS_PROFILE_MEMORY=1`` is also set in
+the environment. It uses tracemalloc, which slows everything in the process
+down several times over and whose peak is shared by all sessions, so keep it
+to a single local session and don't trust the timings taken alongside it.
+
+Summarise a log (p50/p99 per app and section, cache hit rates) with::
+
+    python rerun_profiler.py profile.jsonl
+"""
+import functools
+import json
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+HISTORY_LEN = 200
+UNACCOUNTED = "(unaccounted)"
+_local = threading.local()
+_tracing_lock = threading.Lock()
+_tracing_users = 0
+_owns_tracing = False
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").lower() in ("1", "true", "yes", "on")
+
+
+def _query_enabled() -> bool:
+    try:
+        import streamlit as st
+        return st.query_params.get("profile", "") in ("1", "true", "yes", "on")
+    except Exception:
+        return False
+
+
+def _acquire_tracing():
+    """Start tracemalloc for the first concurrent rerun that wants it."""
+    global _tracing_users, _owns_tracing
+    with _tracing_lock:
+        if _tracing_users == 0:
+            _owns_tracing = not tracemalloc.is_tracing()
+            if _owns_tracing:
+                tracemalloc.start()
+        _tracing_users += 1
+
+
+def _release_tracing():
+    """Stop tracemalloc once the last rerun using it finishes, unless someone else started it."""
+    global _tracing_users
+    with _tracing_lock:
+        _tracing_users -= 1
+        if _tracing_users == 0 and _owns_tracing:
+            tracemalloc.stop()
+
+
+def percentile(values, pct: float) -> float:
+    """Nearest-rank percentile, good enough for latency tracking."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def hit_rate(hits: int, misses: int) -> float:
+    return hits / max(hits + misses, 1)
+
+
+class Profiler:
+    def __init__(self, app: str, enabled: bool, memory: bool = False):
+        self.app = app
+        self.enabled = enabled
+        self.memory = enabled and memory
+        self.sections = []
+        self.cache = {}
+        # The rerun itself is the root frame; sections hand their peaks up to it.
+        self._stack = [{"child_peak": 0}]
+        self._t0 = time.perf_counter()
+        self._mem0 = 0
+        if self.memory:
+            _acquire_tracing()
+            tracemalloc.reset_peak()
+            self._mem0 = tracemalloc.get_traced_memory()[0]
+
+    # ── Sections ──
+    @contextmanager
+    def section(self, name: str):
+        if not self.enabled:
+            yield
+            return
+
+        frame = {"child_peak": 0}
+        if self.memory:
+            frame["mem_start"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        # Appended on entry so sections are listed in the order they started.
+        entry = {"name": name, "ms": 0.0, "peak_mib": None, "depth": len(self._stack) - 1}
+        self.sections.append(entry)
+        self._stack.append(frame)
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - t0
+            self._stack.pop()
+            entry["ms"] = elapsed * 1000
+            if self.memory:
+                # reset_peak() in a nested section clobbers ours, so children
+                # hand their absolute peak back up the stack.
+                abs_peak = max(tracemalloc.get_traced_memory()[1], frame["child_peak"])
+                parent = self._stack[-1]
+                parent["child_peak"] = max(parent["child_peak"], abs_peak)
+                entry["peak_mib"] = max(abs_peak - frame["mem_start"], 0) / 2**20
+
+    # ── Cache hit/miss ──
+    @contextmanager
+    def cache_lookup(self, name: str):
+        """Wrap the call site of a cached function decorated with ``track_cache``."""
+        if not self.enabled:
+            yield
+            return
+
+        stats = self.cache.setdefault(name, {"hits": 0, "misses": 0})
+        _local.missed = set()
+        try:
+            yield
+        finally:
+            if name in _local.missed:
+                stats["misses"] += 1
+            else:
+                stats["hits"] += 1
+            _local.missed = set()
+
+    # ── Reporting ──
+    def record(self) -> dict:
+        total_ms = (time.perf_counter() - self._t0) * 1000
+        peak_mib = None
+        if self.memory:
+            abs_peak = max(tracemalloc.get_traced_memory()[1], self._stack[0]["child_peak"])
+            peak_mib = max(abs_peak - self._mem0, 0) / 2**20
+        top_level_ms = sum(s["ms"] for s in self.sections if s["depth"] == 0)
+        return {
+            "app": self.app,
+            "ts": time.time(),
+            "rerun_ms": total_ms,
+            "unaccounted_ms": max(total_ms - top_level_ms, 0.0),
+            "peak_mib": peak_mib,
+            "sections": self.sections,
+            "cache": self.cache,
+        }
+
+    def finish(self, status: str = "ok"):
+        """Close the rerun: log it and, if it completed, draw the sidebar panel.
+
+        ``status`` is "interrupted" when Streamlit stopped the script for a
+        rerun or ``st.stop()``, and "error" when the script raised. Those
+        reruns are logged and kept in the history too, but the panel is only
+        drawn for complete ones: Streamlit is unwinding the script then, and
+        further element calls may raise again.
+        """
+        if not self.enabled:
+            return
+
+        try:
+            rec = {**self.record(), "status": status}
+        finally:
+            if self.memory:
+                _release_tracing()
+
+        line = json.dumps(rec)
+        log_path = os.environ.get("APPS_PROFILE_LOG")
+        if log_path:
+            with open(log_path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+        if status == "ok":
+            self._publish(rec, line)
+            return
+        try:
+            self._publish(rec, line, panel=False)
+        except Exception:
+            pass  # never mask the exception that ended the script
+
+    def _publish(self, rec: dict, line: str, panel: bool = True):
+        import streamlit as st
+
+        history = st.session_state.setdefault("_profile_history", [])
+        history.append(line)
+        del history[:-HISTORY_LEN]
+        latencies = [json.loads(h)["rerun_ms"] for h in history]
+
+        cache_totals = st.session_state.setdefault("_profile_cache", {})
+        for name, c in rec["cache"].items():
+            total = cache_totals.setdefault(name, {"hits": 0, "misses": 0})
+            total["hits"] += c["hits"]
+            total["misses"] += c["misses"]
+
+        if not panel:
+            return
+
+        def mib(value):
+            return round(value, 2) if value is not None else None
+
+        with st.sidebar.expander("⏱ Profiling", expanded=True):
+            peak = f" · peak {rec['peak_mib']:,.1f} MiB" if rec["peak_mib"] is not None else ""
+            st.caption(f"Rerun: {rec['rerun_ms']:,.1f} ms{peak}")
+            cut_short = sum(json.loads(h).get("status", "ok") != "ok" for h in history)
+            st.caption(
+                f"p50 {percentile(latencies, 50):,.1f} ms · "
+                f"p99 {percentile(latencies, 99):,.1f} ms · "
+                f"{len(latencies)} reruns"
+                + (f" ({cut_short} cut short)" if cut_short else "")
+            )
+            rows = [{"section": "· " * s["depth"] + s["name"],
+                     "ms": round(s["ms"], 2),
+                     "peak MiB": mib(s["peak_mib"])} for s in rec["sections"]]
+            rows.append({"section": UNACCOUNTED, "ms": round(rec["unaccounted_ms"], 2), "peak MiB": None})
+            st.dataframe(rows, hide_index=True, use_container_width=True)
+            if cache_totals:
+                st.caption("Cache, this session")
+                st.dataframe(
+                    [{"cache": name,
+                      "hits": c["hits"],
+                      "misses": c["misses"],
+                      "hit rate": f"{hit_rate(c['hits'], c['misses']):.0%}"}
+                     for name, c in cache_totals.items()],
+                    hide_index=True, use_container_width=True,
+                )
+            st.download_button(
+                "Download session (JSON lines)",
+                "\n".join(history) + "\n",
+                file_name=f"{self.app}_profile.jsonl",
+                mime="application/jsonl",
+            )
+
+
+def start(app: str) -> Profiler:
+    """Begin profiling a rerun. Prefer ``profile()``, which always finishes it."""
+    enabled = _env_flag("APPS_PROFILE") or _query_enabled()
+    # Memory tracing is process-wide, so only the environment can turn it on.
+    return Profiler(app, enabled, memory=_env_flag("APPS_PROFILE_MEMORY"))
+
+
+# Raised by Streamlit to unwind a script on a rerun request or st.stop().
+_INTERRUPTS = ("RerunException", "StopException")
+
+
+@contextmanager
+def profile(app: str):
+    """Profile the script body inside the block, however it ends."""
+    prof = start(app)
+    status = "ok"
+    try:
+        yield prof
+    except BaseException as exc:
+        status = "interrupted" if type(exc).__name__ in _INTERRUPTS else "error"
+        raise
+    finally:
+        prof.finish(status)
+
+
+def track_cache(name: str):
+    """Mark cache misses: put this *under* ``@st.cache_data`` / ``@st.cache_resource``.
+
+    The wrapped body only runs on a miss, so a lookup that finishes without
+    the body being entered is counted as a hit.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            missed = getattr(_local, "missed", None)
+            if missed is not None:
+                missed.add(name)
+            return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+# ─────────────────────────────────────────────
+# LOG SUMMARY
+# ─────────────────────────────────────────────
+def summarize(lines) -> dict:
+    """Latency percentiles per app/section and cache hit rates per app/cache."""
+    per_key = {}
+    cache = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        rec = json.loads(line)
+        per_key.setdefault((rec["app"], "<rerun>"), []).append(rec["rerun_ms"])
+        if "unaccounted_ms" in rec:
+            per_key.setdefault((rec["app"], UNACCOUNTED), []).append(rec["unaccounted_ms"])
+        for s in rec["sections"]:
+            per_key.setdefault((rec["app"], s["name"]), []).append(s["ms"])
+        for name, c in rec.get("cache", {}).items():
+            total = cache.setdefault((rec["app"], name), {"hits": 0, "misses": 0})
+            total["hits"] += c["hits"]
+            total["misses"] += c["misses"]
+
+    latency = []
+    for (app, name), values in sorted(per_key.items()):
+        latency.append({
+            "app": app,
+            "section": name,
+            "n": len(values),
+            "mean_ms": statistics.fmean(values),
+            "p50_ms": percentile(values, 50),
+            "p99_ms": percentile(values, 99),
+        })
+
+    cache_rows = [{"app": app, "cache": name, **c, "hit_rate": hit_rate(c["hits"], c["misses"])}
+                  for (app, name), c in sorted(cache.items())]
+    return {"latency": latency, "cache": cache_rows}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("usage: python rerun_profiler.py PROFILE.jsonl", file=sys.stderr)
+        return 2
+
+    with open(argv[0], encoding="utf-8") as fh:
+        summary = summarize(fh)
+
+    print(f"{'app':<28} {'section':<28} {'n':>6} {'mean ms':>10} {'p50 ms':>10} {'p99 ms':>10}")
+    for r in summary["latency"]:
+        print(f"{r['app']:<28} {r['section']:<28} {r['n']:>6} "
+              f"{r['mean_ms']:>10.1f} {r['p50_ms']:>10.1f} {r['p99_ms']:>10.1f}")
+
+    if summary["cache"]:
+        print()
+        print(f"{'app':<28} {'cache':<28} {'hits':>8} {'misses':>8} {'hit rate':>9}")
+        for r in summary["cache"]:
+            print(f"{r['app']:<28} {r['cache']:<28} {r['hits']:>8} {r['misses']:>8} {r['hit_rate']:>9.0%}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,163 @@
+import json
+import sys
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+import rerun_profiler
+from rerun_profiler import Profiler, percentile, summarize
+
+
+@pytest.fixture(autouse=True)
+def no_stray_tracing():
+    yield
+    assert rerun_profiler._tracing_users == 0
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def finish_memory(prof):
+    rec = prof.record()
+    rerun_profiler._release_tracing()
+    return rec
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile(values, 100) == 100
+    assert percentile([7], 99) == 7
+    assert percentile([1, 2, 3, 4, 5], 50) == 3
+    assert percentile([3, 1, 2], 50) == 2
+    assert percentile([1, 2, 3], 99) == 3
+    assert percentile(list(range(1, 151)), 99) == 149
+    assert percentile([], 50) == 0.0
+
+
+def test_disabled_profiler_records_nothing():
+    prof = Profiler("app", enabled=False, memory=True)
+    with prof.section("a"), prof.cache_lookup("c"):
+        pass
+    assert prof.sections == [] and prof.cache == {}
+    assert not tracemalloc.is_tracing()
+
+
+def test_sections_nest_and_unaccounted_covers_the_rest():
+    prof = Profiler("app", enabled=True)
+    with prof.section("outer"):
+        with prof.section("inner"):
+            pass
+    rec = prof.record()
+
+    assert [(s["name"], s["depth"]) for s in rec["sections"]] == [("outer", 0), ("inner", 1)]
+    assert rec["peak_mib"] is None
+    outer_ms = rec["sections"][0]["ms"]
+    assert rec["unaccounted_ms"] == pytest.approx(rec["rerun_ms"] - outer_ms, abs=1e-6)
+    assert not tracemalloc.is_tracing()
+
+
+def test_peaks_propagate_to_parent_and_rerun():
+    prof = Profiler("app", enabled=True, memory=True)
+    with prof.section("outer"):
+        with prof.section("alloc"):
+            blob = bytearray(8 * 2**20)
+            del blob
+        with prof.section("small"):
+            pass
+    with prof.section("after"):
+        pass
+    rec = finish_memory(prof)
+
+    peaks = {s["name"]: s["peak_mib"] for s in rec["sections"]}
+    assert peaks["alloc"] >= 8
+    assert peaks["outer"] >= peaks["alloc"]
+    assert peaks["after"] < 1
+    assert rec["peak_mib"] >= peaks["alloc"]
+    assert not tracemalloc.is_tracing()
+
+
+def test_release_leaves_foreign_tracing_running():
+    tracemalloc.start()
+    prof = Profiler("app", enabled=True, memory=True)
+    finish_memory(prof)
+    assert tracemalloc.is_tracing()
+
+
+def test_cache_hits_and_misses():
+    calls = []
+
+    @rerun_profiler.track_cache("load")
+    def load():
+        calls.append(1)
+
+    prof = Profiler("app", enabled=True)
+    with prof.cache_lookup("load"):
+        load()  # body runs: a miss
+    with prof.cache_lookup("load"):
+        pass  # a cached call never enters the body: a hit
+    assert prof.cache == {"load": {"hits": 1, "misses": 1}}
+
+
+def test_summarize_latency_and_cache_hit_rates():
+    lines = [
+        json.dumps({"app": "a", "rerun_ms": 10, "unaccounted_ms": 2,
+                    "sections": [{"name": "x", "ms": 3}],
+                    "cache": {"load": {"hits": 0, "misses": 1}}}),
+        json.dumps({"app": "a", "rerun_ms": 30, "unaccounted_ms": 4,
+                    "sections": [{"name": "x", "ms": 5}],
+                    "cache": {"load": {"hits": 1, "misses": 0}}}),
+        json.dumps({"app": "a", "rerun_ms": 20, "sections": [],
+                    "cache": {"load": {"hits": 1, "misses": 0}}}),
+        "",
+    ]
+    summary = summarize(lines)
+
+    latency = {r["section"]: r for r in summary["latency"]}
+    assert latency["<rerun>"]["n"] == 3
+    assert latency["<rerun>"]["p50_ms"] == 20
+    assert latency["<rerun>"]["p99_ms"] == 30
+    assert latency["x"]["mean_ms"] == 4
+    assert latency[rerun_profiler.UNACCOUNTED]["n"] == 2
+
+    assert summary["cache"] == [
+        {"app": "a", "cache": "load", "hits": 2, "misses": 1, "hit_rate": pytest.approx(2 / 3)},
+    ]
+
+
+@pytest.fixture
+def profile_env(tmp_path, monkeypatch):
+    log = tmp_path / "profile.jsonl"
+    monkeypatch.setenv("APPS_PROFILE", "1")
+    monkeypatch.setenv("APPS_PROFILE_MEMORY", "1")
+    monkeypatch.setenv("APPS_PROFILE_LOG", str(log))
+    return log
+
+
+def test_failed_rerun_is_logged_and_releases_tracing(profile_env):
+    with pytest.raises(ValueError):
+        with rerun_profiler.profile("app") as prof:
+            with prof.section("boom"):
+                raise ValueError("bad upload")
+
+    (rec,) = [json.loads(line) for line in profile_env.read_text().splitlines()]
+    assert rec["status"] == "error"
+    assert [s["name"] for s in rec["sections"]] == ["boom"]
+    assert rec["sections"][0]["ms"] > 0
+    assert rerun_profiler._tracing_users == 0
+    assert not tracemalloc.is_tracing()
+
+
+def test_interrupted_rerun_is_logged(profile_env):
+    class RerunException(Exception):
+        """Stands in for Streamlit's, which unwinds a script on a widget click."""
+
+    with pytest.raises(RerunException):
+        with rerun_profiler.profile("app"):
+            raise RerunException
+
+    (rec,) = [json.loads(line) for line in profile_env.read_text().splitlines()]
+    assert rec["status"] == "interrupted"
+    assert not tracemalloc.is_tracing()
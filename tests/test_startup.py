@@ -0,0 +1,39 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import startup
+
+
+def importtime(level, name, cumulative, self_us=1):
+    return f"import time: {self_us:>9} | {cumulative:>10} | {'  ' * level}{name}"
+
+
+def test_parse_importtime_attributes_nested_heavy_packages():
+    # -X importtime logs each module after everything it imported.
+    stderr = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        importtime(0, "streamlit", 5000),  # before the run: ignored
+        importtime(0, "pandas", 999),
+        startup.RUN_MARKER,
+        "import time: self [us] | cumulative | imported package",
+        importtime(3, "numpy._core", 300),
+        importtime(2, "numpy", 800),
+        importtime(2, "pandas.core", 400),
+        importtime(1, "pandas", 2000),
+        importtime(0, "housing_model", 2500),
+        importtime(1, "plotly.io", 500),
+        importtime(0, "plotly", 900),
+        importtime(0, "json", 50),
+    ])
+
+    result = startup.parse_importtime(stderr)
+
+    assert result["imports_ms"] == pytest.approx(3.45)
+    assert result["pandas_ms"] == pytest.approx(2.0)
+    assert result["numpy_ms"] == pytest.approx(0.8)
+    assert result["plotly_ms"] == pytest.approx(0.9)
+    assert result["sklearn_ms"] == 0
+    assert result["pyarrow_ms"] == 0